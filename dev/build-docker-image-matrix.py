@@ -3,10 +3,12 @@ Usage: python dev/build-docker-image-matrix.py --flwr-version <flower version e.
 """
 
 import argparse
-import json
-from dataclasses import asdict, dataclass
+import sys
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
 
 
 class DistroName(str, Enum):
@@ -14,11 +16,18 @@ class DistroName(str, Enum):
     UBUNTU = "ubuntu"
 
 
-@dataclass
+# `__slots__` is spelled out on the dataclasses below because the script still
+# runs on Python 3.9 in CI, which predates `@dataclass(slots=True)`
+@dataclass(frozen=True)
 class Distro:
+    __slots__ = ("name", "version")
+
     name: "DistroName"
     version: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name.value, "version": self.version}
+
 
 LATEST_SUPPORTED_PYTHON_VERSION = "3.11"
 SUPPORTED_PYTHON_VERSIONS = [
@@ -30,8 +39,17 @@ SUPPORTED_PYTHON_VERSIONS = [
 DOCKERFILE_ROOT = "src/docker"
 
 
-@dataclass
+@dataclass(frozen=True)
 class BaseImage:
+    __slots__ = (
+        "distro",
+        "python_version",
+        "namespace_repository",
+        "file_dir",
+        "tag",
+        "flwr_version",
+    )
+
     distro: Distro
     python_version: str
     namespace_repository: str
@@ -39,6 +57,16 @@ class BaseImage:
     tag: str
     flwr_version: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "distro": self.distro.to_dict(),
+            "python_version": self.python_version,
+            "namespace_repository": self.namespace_repository,
+            "file_dir": self.file_dir,
+            "tag": self.tag,
+            "flwr_version": self.flwr_version,
+        }
+
 
 def new_base_image(
     flwr_version: str, python_version: str, distro: Distro
@@ -53,38 +81,56 @@ def new_base_image(
     )
 
 
+# (distro, python version) pairs for all base images, computed once and shared:
+# ubuntu images for each supported python version, alpine images for the latest
+# supported python version only
+BASE_IMAGE_VARIANTS = [
+    (Distro(DistroName.UBUNTU, "24.04"), python_version)
+    for python_version in SUPPORTED_PYTHON_VERSIONS
+] + [(Distro(DistroName.ALPINE, "3.19"), LATEST_SUPPORTED_PYTHON_VERSION)]
+
+
 def generate_base_images(
-    flwr_version: str, python_versions: List[str], distros: List[Dict[str, str]]
+    flwr_version: str,
+    variants: List[Tuple[Distro, str]] = BASE_IMAGE_VARIANTS,
 ) -> List[Dict[str, Any]]:
     return [
         new_base_image(flwr_version, python_version, distro)
-        for distro in distros
-        for python_version in python_versions
+        for distro, python_version in variants
     ]
 
 
-@dataclass
+@dataclass(frozen=True)
 class BinaryImage:
+    __slots__ = ("namespace_repository", "file_dir", "base_image", "tags")
+
     namespace_repository: str
     file_dir: str
     base_image: str
-    tags: List[str]
+    tags: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "namespace_repository": self.namespace_repository,
+            "file_dir": self.file_dir,
+            "base_image": self.base_image,
+            "tags": self.tags,
+        }
 
 
 def new_binary_image(
-    name: str,
+    namespace_repository: str,
+    file_dir: str,
     base_image: BaseImage,
     tags_fn: Optional[Callable],
 ) -> Dict[str, Any]:
-    tags = []
-    if tags_fn is not None:
-        tags += tags_fn(base_image) or []
+    tags = tags_fn(base_image) if tags_fn is not None else None
 
     return BinaryImage(
-        f"flwr/{name}",
-        f"{DOCKERFILE_ROOT}/{name}",
+        namespace_repository,
+        file_dir,
         base_image.tag,
-        "\n".join(tags),
+        "\n".join(tags) if tags else "",
     )
 
 
@@ -92,33 +138,37 @@ def generate_binary_images(
     name: str,
     base_images: List[BaseImage],
     tags_fn: Optional[Callable] = None,
-    filter: Optional[Callable] = None,
 ) -> List[Dict[str, Any]]:
-    filter = filter or (lambda _: True)
+    # Identical for every image of this binary, so build the strings only once
+    namespace_repository = f"flwr/{name}"
+    file_dir = f"{DOCKERFILE_ROOT}/{name}"
 
     return [
-        new_binary_image(name, image, tags_fn) for image in base_images if filter(image)
+        new_binary_image(namespace_repository, file_dir, image, tags_fn)
+        for image in base_images
     ]
 
 
-def tag_latest_alpine_with_flwr_version(image: BaseImage) -> List[str]:
-    if (
-        image.distro.name == DistroName.ALPINE
-        and image.python_version == LATEST_SUPPORTED_PYTHON_VERSION
-    ):
-        return [image.tag, image.flwr_version]
-    else:
-        return [image.tag]
+def tag_latest_with_flwr_version(distro_name: DistroName) -> Callable:
+    """Build a tags_fn that adds the bare flwr version tag for images of the
+    given distro on the latest supported python version."""
+
+    def tags_fn(image: BaseImage) -> List[str]:
+        # Enum members are singletons, so the cheaper identity check suffices
+        if (
+            image.distro.name is distro_name
+            and image.python_version == LATEST_SUPPORTED_PYTHON_VERSION
+        ):
+            return [image.tag, image.flwr_version]
+        else:
+            return [image.tag]
+
+    return tags_fn
 
 
-def tag_latest_ubuntu_with_flwr_version(image: BaseImage) -> List[str]:
-    if (
-        image.distro.name == DistroName.UBUNTU
-        and image.python_version == LATEST_SUPPORTED_PYTHON_VERSION
-    ):
-        return [image.tag, image.flwr_version]
-    else:
-        return [image.tag]
+# Shared tags_fn closures, built once per distro
+tag_latest_alpine_with_flwr_version = tag_latest_with_flwr_version(DistroName.ALPINE)
+tag_latest_ubuntu_with_flwr_version = tag_latest_with_flwr_version(DistroName.UBUNTU)
 
 
 if __name__ == "__main__":
@@ -130,70 +180,52 @@ if __name__ == "__main__":
 
     flwr_version = args.flwr_version
 
-    # ubuntu base images for each supported python version
-    ubuntu_base_images = generate_base_images(
-        flwr_version,
-        SUPPORTED_PYTHON_VERSIONS,
-        [Distro(DistroName.UBUNTU, "24.04")],
-    )
-    # alpine base images for the latest supported python version
-    alpine_base_images = generate_base_images(
-        flwr_version,
-        [LATEST_SUPPORTED_PYTHON_VERSION],
-        [Distro(DistroName.ALPINE, "3.19")],
-    )
-
-    base_images = ubuntu_base_images + alpine_base_images
+    base_images = generate_base_images(flwr_version)
+
+    # Partition the base images in a single pass instead of re-filtering the
+    # full list once per binary
+    superlink_images = []  # ubuntu and alpine, latest supported python version
+    supernode_images = []  # all ubuntu plus alpine on the latest python version
+    ubuntu_images = []  # ubuntu, each supported python version
+    for image in base_images:
+        is_latest = image.python_version == LATEST_SUPPORTED_PYTHON_VERSION
+        if is_latest:
+            superlink_images.append(image)
+        if image.distro.name is DistroName.UBUNTU:
+            ubuntu_images.append(image)
+            supernode_images.append(image)
+        elif is_latest:
+            supernode_images.append(image)
 
     binary_images = (
-        # ubuntu and alpine images for the latest supported python version
         generate_binary_images(
-            "superlink",
-            base_images,
-            tag_latest_alpine_with_flwr_version,
-            lambda image: image.python_version == LATEST_SUPPORTED_PYTHON_VERSION,
+            "superlink", superlink_images, tag_latest_alpine_with_flwr_version
         )
-        # ubuntu images for each supported python version
         + generate_binary_images(
-            "supernode",
-            base_images,
-            tag_latest_alpine_with_flwr_version,
-            lambda image: image.distro.name == DistroName.UBUNTU
-            or (
-                image.distro.name == DistroName.ALPINE
-                and image.python_version == LATEST_SUPPORTED_PYTHON_VERSION
-            ),
+            "supernode", supernode_images, tag_latest_alpine_with_flwr_version
         )
-        # ubuntu images for each supported python version
         + generate_binary_images(
-            "serverapp",
-            base_images,
-            tag_latest_ubuntu_with_flwr_version,
-            lambda image: image.distro.name == DistroName.UBUNTU,
+            "serverapp", ubuntu_images, tag_latest_ubuntu_with_flwr_version
         )
-        # ubuntu images for each supported python version
         + generate_binary_images(
-            "superexec",
-            base_images,
-            tag_latest_ubuntu_with_flwr_version,
-            lambda image: image.distro.name == DistroName.UBUNTU,
+            "superexec", ubuntu_images, tag_latest_ubuntu_with_flwr_version
         )
-        # ubuntu images for each supported python version
         + generate_binary_images(
-            "clientapp",
-            base_images,
-            tag_latest_ubuntu_with_flwr_version,
-            lambda image: image.distro.name == DistroName.UBUNTU,
+            "clientapp", ubuntu_images, tag_latest_ubuntu_with_flwr_version
         )
     )
 
-    print(
-        json.dumps(
-            {
-                "base": {"images": list(map(lambda image: asdict(image), base_images))},
-                "binary": {
-                    "images": list(map(lambda image: asdict(image), binary_images))
-                },
-            }
-        )
-    )
+    # Stream the matrix image by image instead of materializing the whole
+    # JSON payload in memory first
+    stdout = sys.stdout.buffer
+    stdout.write(b'{"base":{"images":[')
+    for i, image in enumerate(base_images):
+        if i:
+            stdout.write(b",")
+        stdout.write(orjson.dumps(image.to_dict()))
+    stdout.write(b']},"binary":{"images":[')
+    for i, image in enumerate(binary_images):
+        if i:
+            stdout.write(b",")
+        stdout.write(orjson.dumps(image.to_dict()))
+    stdout.write(b"]}}")
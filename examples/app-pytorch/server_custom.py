@@ -122,15 +122,17 @@ def main(driver: Driver, context: Context) -> None:
         weights_results: List[Tuple[NDArrays, int]] = []
         metrics_results: List[Tuple[int, Dict]] = []
         for fitres in all_fitres:
-            print(f"num_examples: {fitres.num_examples}, status: {fitres.status.code}")
+            num_examples = fitres.num_examples
+            status_code = fitres.status.code
+            print(f"num_examples: {num_examples}, status: {status_code}")
 
             # Aggregate only if the status is OK
-            if fitres.status.code != Code.OK:
+            if status_code != Code.OK:
                 continue
             weights_results.append(
-                (parameters_to_ndarrays(fitres.parameters), fitres.num_examples)
+                (parameters_to_ndarrays(fitres.parameters), num_examples)
             )
-            metrics_results.append((fitres.num_examples, fitres.metrics))
+            metrics_results.append((num_examples, fitres.metrics))
 
         if len(weights_results) > 0:
             # Aggregate parameters (FedAvg)
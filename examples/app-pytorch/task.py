@@ -1,4 +1,3 @@
-from collections import OrderedDict
 from logging import INFO
 
 import torch
@@ -89,5 +88,5 @@ def get_weights(net):
 
 def set_weights(net, parameters):
     params_dict = zip(net.state_dict().keys(), parameters)
-    state_dict = OrderedDict({k: torch.tensor(v) for k, v in params_dict})
+    state_dict = {k: torch.tensor(v) for k, v in params_dict}
     net.load_state_dict(state_dict, strict=True)
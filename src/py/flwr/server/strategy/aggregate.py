@@ -29,16 +29,20 @@ def aggregate(results: list[tuple[NDArrays, int]]) -> NDArrays:
     # Calculate the total number of examples used during training
     num_examples_total = sum(num_examples for (_, num_examples) in results)
 
-    # Create a list of weights, each multiplied by the related number of examples
-    weighted_weights = [
-        [layer * num_examples for layer in weights] for weights, num_examples in results
-    ]
-
-    # Compute average weights of each layer
+    # Scale the first result into a fresh accumulator, then add the remaining
+    # weighted results in place. Accumulating with `out=` keeps a single
+    # buffer per layer instead of materializing all weighted updates at once.
+    first_weights, first_num_examples = results[0]
     weights_prime: NDArrays = [
-        reduce(np.add, layer_updates) / num_examples_total
-        for layer_updates in zip(*weighted_weights)
+        layer * float(first_num_examples) for layer in first_weights
     ]
+    for weights, num_examples in results[1:]:
+        for layer_prime, layer in zip(weights_prime, weights):
+            np.add(layer_prime, layer * float(num_examples), out=layer_prime)
+
+    # Normalize by the total number of examples
+    for layer_prime in weights_prime:
+        np.divide(layer_prime, num_examples_total, out=layer_prime)
     return weights_prime
 
 
@@ -226,15 +230,12 @@ def aggregate_qffl(
 ) -> NDArrays:
     """Compute weighted average based on Q-FFL paper."""
     demominator: float = np.sum(np.asarray(hs_fll))
-    scaled_deltas = []
-    for client_delta in deltas:
-        scaled_deltas.append([layer * 1.0 / demominator for layer in client_delta])
-    updates = []
-    for i in range(len(deltas[0])):
-        tmp = scaled_deltas[0][i]
-        for j in range(1, len(deltas)):
-            tmp += scaled_deltas[j][i]
-        updates.append(tmp)
+    # Stack the per-client deltas of each layer into one buffer and reduce it
+    # in a single C-level call instead of accumulating client by client
+    updates = [
+        np.add.reduce(np.stack(layer_deltas) / demominator, axis=0)
+        for layer_deltas in zip(*deltas)
+    ]
     new_parameters = [(u - v) * 1.0 for u, v in zip(parameters, updates)]
     return new_parameters
 
@@ -51,11 +51,11 @@ def _register_nodes(
     num_nodes: int, state_factory: LinkStateFactory
 ) -> NodeToPartitionMapping:
     """Register nodes with the StateFactory and create node-id:partition-id mapping."""
-    nodes_mapping: NodeToPartitionMapping = {}
     state = state_factory.state()
-    for i in range(num_nodes):
-        node_id = state.create_node(ping_interval=PING_MAX_INTERVAL)
-        nodes_mapping[node_id] = i
+    node_ids = state.create_nodes(num_nodes=num_nodes, ping_interval=PING_MAX_INTERVAL)
+    nodes_mapping: NodeToPartitionMapping = {
+        node_id: i for i, node_id in enumerate(node_ids)
+    }
     log(DEBUG, "Registered %i nodes", len(nodes_mapping))
     return nodes_mapping
 
@@ -66,21 +66,21 @@ def _register_node_info_stores(
     app_dir: Optional[str] = None,
 ) -> dict[int, DeprecatedRunInfoStore]:
     """Create DeprecatedRunInfoStore objects and register the context for the run."""
-    node_info_store: dict[int, DeprecatedRunInfoStore] = {}
     num_partitions = len(set(nodes_mapping.values()))
-    for node_id, partition_id in nodes_mapping.items():
-        node_info_store[node_id] = DeprecatedRunInfoStore(
+    node_info_store: dict[int, DeprecatedRunInfoStore] = {
+        node_id: DeprecatedRunInfoStore(
             node_id=node_id,
             node_config={
                 PARTITION_ID_KEY: partition_id,
                 NUM_PARTITIONS_KEY: num_partitions,
             },
         )
+        for node_id, partition_id in nodes_mapping.items()
+    }
 
-        # Pre-register Context objects
-        node_info_store[node_id].register_context(
-            run_id=run.run_id, run=run, app_dir=app_dir
-        )
+    # Pre-register Context objects
+    for info_store in node_info_store.values():
+        info_store.register_context(run_id=run.run_id, run=run, app_dir=app_dir)
 
     return node_info_store
 
@@ -288,6 +288,11 @@ def start_vce(
                 "`existing_nodes_mapping` you must supply `num_supernodes` to indicate "
                 "how many nodes to insert into a new StateFactory that will be created."
             )
+    # Load backend config. Parsing it first means a malformed config fails
+    # fast, before any nodes are registered.
+    log(DEBUG, "Supported backends: %s", list(supported_backends.keys()))
+    backend_config = json.loads(backend_config_json_stream)
+
     if existing_nodes_mapping:
         if state_factory is None:
             raise ValueError(
@@ -317,10 +322,6 @@ def start_vce(
         nodes_mapping=nodes_mapping, run=run, app_dir=app_dir if is_app else None
     )
 
-    # Load backend config
-    log(DEBUG, "Supported backends: %s", list(supported_backends.keys()))
-    backend_config = json.loads(backend_config_json_stream)
-
     try:
         backend_type = supported_backends[backend_name]
     except KeyError as ex:
@@ -340,35 +341,29 @@ def start_vce(
         """Instantiate a Backend."""
         return backend_type(backend_config)
 
-    # Load ClientApp if needed
+    # Load ClientApp if needed. The loaded app is memoized so repeated calls
+    # (e.g. one per backend worker) skip the low-level loading entirely.
     def _load() -> ClientApp:
+        nonlocal client_app
 
         if client_app:
             return client_app
         if client_app_attr:
-            return get_load_client_app_fn(
+            client_app = get_load_client_app_fn(
                 default_app_ref=client_app_attr,
                 app_path=app_dir,
                 flwr_dir=flwr_dir,
                 multi_app=False,
             )(run.fab_id, run.fab_version, run.fab_hash)
+            return client_app
 
         raise ValueError("Either `client_app_attr` or `client_app` must be provided")
 
     app_fn = _load
 
     try:
-        # Test if ClientApp can be loaded
-        client_app = app_fn()
-
-        # Cache `ClientApp`
-        if client_app_attr:
-            # Now wrap the loaded ClientApp in a dummy function
-            # this prevent unnecesary low-level loading of ClientApp
-            def _load_client_app() -> ClientApp:
-                return client_app
-
-            app_fn = _load_client_app
+        # Test if ClientApp can be loaded (and cache it)
+        app_fn()
 
         # Run main simulation loop
         run_api(
@@ -322,6 +322,20 @@ class InMemoryLinkState(LinkState):  # pylint: disable=R0902,R0904
             self.node_ids[node_id] = (time.time() + ping_interval, ping_interval)
             return node_id
 
+    def create_nodes(self, num_nodes: int, ping_interval: float) -> list[int]:
+        """Create `num_nodes` nodes in one batch and return their node IDs."""
+        online_until = time.time() + ping_interval
+        node_ids: list[int] = []
+        with self.lock:
+            while len(node_ids) < num_nodes:
+                # Sample a random int64 as node_id and resample on collision
+                node_id = generate_rand_int_from_bytes(NODE_ID_NUM_BYTES)
+                if node_id in self.node_ids:
+                    continue
+                self.node_ids[node_id] = (online_until, ping_interval)
+                node_ids.append(node_id)
+        return node_ids
+
     def delete_node(self, node_id: int, public_key: Optional[bytes] = None) -> None:
         """Delete a node."""
         with self.lock:
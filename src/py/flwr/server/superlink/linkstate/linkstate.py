@@ -133,6 +133,14 @@ class LinkState(abc.ABC):  # pylint: disable=R0904
     ) -> int:
         """Create, store in the link state, and return `node_id`."""
 
+    def create_nodes(self, num_nodes: int, ping_interval: float) -> list[int]:
+        """Create `num_nodes` nodes in one batch and return their node IDs.
+
+        Implementations backed by a database should override this method to register all
+        nodes in a single round-trip.
+        """
+        return [self.create_node(ping_interval=ping_interval) for _ in range(num_nodes)]
+
     @abc.abstractmethod
     def delete_node(self, node_id: int, public_key: Optional[bytes] = None) -> None:
         """Remove `node_id` from the link state."""
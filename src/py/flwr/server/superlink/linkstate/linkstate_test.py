@@ -456,6 +456,20 @@ class StateTest(unittest.TestCase):
         for i in retrieved_node_ids:
             assert i in node_ids
 
+    def test_create_nodes_and_get_nodes(self) -> None:
+        """Test creating client nodes in one batch."""
+        # Prepare
+        state: LinkState = self.state_factory()
+        run_id = state.create_run(None, None, "9f86d08", {})
+
+        # Execute
+        node_ids = state.create_nodes(num_nodes=10, ping_interval=10)
+        retrieved_node_ids = state.get_nodes(run_id)
+
+        # Assert
+        assert len(node_ids) == 10
+        assert retrieved_node_ids == set(node_ids)
+
     def test_create_node_public_key(self) -> None:
         """Test creating a client node with public key."""
         # Prepare
@@ -731,6 +731,35 @@ class SqliteLinkState(LinkState):  # pylint: disable=R0904
         # Note: we need to return the uint64 value of the node_id
         return uint64_node_id
 
+    def create_nodes(self, num_nodes: int, ping_interval: float) -> list[int]:
+        """Create `num_nodes` nodes in a single INSERT and return their node IDs."""
+        # Sample random uint64 values as node_ids
+        uint64_node_ids = [
+            generate_rand_int_from_bytes(NODE_ID_NUM_BYTES) for _ in range(num_nodes)
+        ]
+
+        online_until = time.time() + ping_interval
+        rows = [
+            # Convert the uint64 values to sint64 for SQLite
+            (convert_uint64_to_sint64(node_id), online_until, ping_interval, None)
+            for node_id in uint64_node_ids
+        ]
+
+        query = (
+            "INSERT INTO node "
+            "(node_id, online_until, ping_interval, public_key) "
+            "VALUES (?, ?, ?, ?)"
+        )
+
+        try:
+            self.query(query, rows)
+        except sqlite3.IntegrityError:
+            log(ERROR, "Unexpected node registration failure.")
+            return []
+
+        # Note: we need to return the uint64 values of the node_ids
+        return uint64_node_ids
+
     def delete_node(self, node_id: int, public_key: Optional[bytes] = None) -> None:
         """Delete a node."""
         # Convert the uint64 value to sint64 for SQLite
@@ -29,6 +29,7 @@ from flwr.common import (
     FitRes,
     GetParametersIns,
     ParametersRecord,
+    RecordSet,
     log,
 )
 from flwr.common.constant import MessageType, MessageTypeLegacy
@@ -250,16 +251,24 @@ def default_fit_workflow(  # pylint: disable=R0914
     # Build dictionary mapping node_id to ClientProxy
     node_id_to_proxy = {proxy.node_id: proxy for proxy, _ in client_instructions}
 
-    # Build out messages
-    out_messages = [
-        driver.create_message(
-            content=compat.fitins_to_recordset(fitins, True),
-            message_type=MessageType.TRAIN,
-            dst_node_id=proxy.node_id,
-            group_id=str(current_round),
+    # Build out messages. Strategies such as FedAvg pair every client with the
+    # same `FitIns` object, so convert each unique object to a `RecordSet` only
+    # once and share the result across messages.
+    contents: dict[int, RecordSet] = {}
+    out_messages = []
+    for proxy, fitins in client_instructions:
+        content = contents.get(id(fitins))
+        if content is None:
+            content = compat.fitins_to_recordset(fitins, True)
+            contents[id(fitins)] = content
+        out_messages.append(
+            driver.create_message(
+                content=content,
+                message_type=MessageType.TRAIN,
+                dst_node_id=proxy.node_id,
+                group_id=str(current_round),
+            )
         )
-        for proxy, fitins in client_instructions
-    ]
 
     # Send instructions to clients and
     # collect `fit` results from all clients participating in this round
@@ -336,16 +345,23 @@ def default_evaluate_workflow(driver: Driver, context: Context) -> None:
     # Build dictionary mapping node_id to ClientProxy
     node_id_to_proxy = {proxy.node_id: proxy for proxy, _ in client_instructions}
 
-    # Build out messages
-    out_messages = [
-        driver.create_message(
-            content=compat.evaluateins_to_recordset(evalins, True),
-            message_type=MessageType.EVALUATE,
-            dst_node_id=proxy.node_id,
-            group_id=str(current_round),
+    # Build out messages, converting each unique `EvaluateIns` object to a
+    # `RecordSet` only once (see `default_fit_workflow`)
+    contents: dict[int, RecordSet] = {}
+    out_messages = []
+    for proxy, evalins in client_instructions:
+        content = contents.get(id(evalins))
+        if content is None:
+            content = compat.evaluateins_to_recordset(evalins, True)
+            contents[id(evalins)] = content
+        out_messages.append(
+            driver.create_message(
+                content=content,
+                message_type=MessageType.EVALUATE,
+                dst_node_id=proxy.node_id,
+                group_id=str(current_round),
+            )
         )
-        for proxy, evalins in client_instructions
-    ]
 
     # Send instructions to clients and
     # collect `evaluate` results from all clients participating in this round